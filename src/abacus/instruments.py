@@ -47,7 +47,16 @@ class Instrument(ABC):
 
     def _log_return_history(self) -> pd.DataFrame:
         if self._has_prices:
-            return np.log(self.price_history / self.price_history.shift(1))[1:]
+            # Differencing log prices on the underlying array avoids pandas temporaries and index
+            # alignment.
+            prices = self.price_history.to_numpy(dtype=np.float64)
+            log_returns = np.diff(np.log(prices), axis=0)
+            index = self.price_history.index[1:]
+            if isinstance(self.price_history, pd.Series):
+                return pd.Series(log_returns, index=index, name=self.price_history.name)
+            return pd.DataFrame(
+                log_returns, index=index, columns=self.price_history.columns
+            )
         else:
             raise ValueError("No price history exists.")
 
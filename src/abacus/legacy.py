@@ -1,43 +1,362 @@
 # -*- coding: utf-8 -*-
+import math
 import numpy as np
 
+from functools import partial
+from multiprocessing import Pool, current_process
+
+from numba import njit
 from matplotlib import pyplot as plt
 from statsmodels.graphics.gofplots import qqplot
 from scipy.stats import norm
-from scipy.optimize import minimize
+from scipy.optimize import minimize, basinhopping
 
-from abacus.utilities.norm_poisson_mixture import npm
+from abacus.config import EPSILON
+from abacus.simulator.model import NoParametersError
+from abacus.utilities.norm_poisson_mixture import norm_poisson_mix_logpdf
 from abacus.utilities.student_poisson_mixture import spm
 
 
+@njit("float64[:](float64[:], float64[:])", cache=True, fastmath=True)
+def _squared_volatility_path(params, data):
+    """
+    Compiled GJR-GARCH(1,1) variance recursion, shared by all innovation distributions. See
+    EquityModel._likelihood_function_normal for the parameter layout. Returns the squared
+    volatility estimate for every observation.
+    """
+    omega, alpha, beta0, beta1 = params[0], params[1], params[2], params[3]
+    n_observations = len(data)
+    squared_vol_estimates = np.empty(n_observations)
+
+    squared_observation = data[0] * data[0]
+    squared_vol_estimates[0] = omega + squared_observation * (
+        alpha + beta0 + beta1 * (data[0] < 0.0)
+    )
+
+    for i in range(1, n_observations):
+        squared_observation = data[i - 1] * data[i - 1]
+        squared_vol_estimates[i] = (
+            omega
+            + (alpha + beta1 * (data[i - 1] < 0.0)) * squared_observation
+            + beta0 * squared_vol_estimates[i - 1]
+        )
+
+    return squared_vol_estimates
+
+
+@njit("float64(float64[:], float64[:])", cache=True, fastmath=True)
+def _garch_nll_normal(params, data):
+    """
+    Compiled negative log-likelihood of the GJR-GARCH(1,1) model with normal innovations. Only
+    the current variance is carried, such that the optimizer objective does not allocate.
+    """
+    omega, alpha, beta0, beta1, mu = (
+        params[0],
+        params[1],
+        params[2],
+        params[3],
+        params[4],
+    )
+    n_observations = len(data)
+    log_likelihood = 0.0
+
+    squared_observation = data[0] * data[0]
+    current_squared_vol_estimate = omega + squared_observation * (
+        alpha + beta0 + beta1 * (data[0] < 0.0)
+    )
+
+    for i in range(1, n_observations):
+        # Parameters outside the admissible set may yield a non-positive variance.
+        if current_squared_vol_estimate <= 0.0:
+            return np.inf
+        residual = data[i - 1] - mu
+        log_likelihood += residual * residual / current_squared_vol_estimate + math.log(
+            current_squared_vol_estimate
+        )
+        squared_observation = data[i - 1] * data[i - 1]
+        current_squared_vol_estimate = (
+            omega
+            + (alpha + beta1 * (data[i - 1] < 0.0)) * squared_observation
+            + beta0 * current_squared_vol_estimate
+        )
+
+    return log_likelihood
+
+
+@njit("float64[:](float64[:], float64[:])", cache=True, fastmath=True)
+def _garch_nll_grad_normal(params, data):
+    """
+    Exact gradient of _garch_nll_normal with respect to the parameters. The sensitivities of the
+    squared volatility estimate are propagated through the same recursion as the estimate itself,
+    so one pass over the data replaces the finite difference evaluations done by the optimizer.
+    """
+    omega, alpha, beta0, beta1, mu = (
+        params[0],
+        params[1],
+        params[2],
+        params[3],
+        params[4],
+    )
+    n_observations = len(data)
+    gradient = np.zeros(5)
+    vol_gradient = np.zeros(5)
+
+    indicator = 1.0 * (data[0] < 0.0)
+    squared_observation = data[0] * data[0]
+    current_squared_vol_estimate = omega + squared_observation * (
+        alpha + beta0 + beta1 * indicator
+    )
+    vol_gradient[0] = 1.0
+    vol_gradient[1] = squared_observation
+    vol_gradient[2] = squared_observation
+    vol_gradient[3] = indicator * squared_observation
+
+    for i in range(1, n_observations):
+        residual = data[i - 1] - mu
+        inverse_vol = 1.0 / current_squared_vol_estimate
+        vol_weight = inverse_vol - residual * residual * inverse_vol * inverse_vol
+        for j in range(4):
+            gradient[j] += vol_weight * vol_gradient[j]
+        gradient[4] -= 2.0 * residual * inverse_vol
+
+        indicator = 1.0 * (data[i - 1] < 0.0)
+        squared_observation = data[i - 1] * data[i - 1]
+        for j in range(4):
+            vol_gradient[j] *= beta0
+        vol_gradient[0] += 1.0
+        vol_gradient[1] += squared_observation
+        vol_gradient[2] += current_squared_vol_estimate
+        vol_gradient[3] += indicator * squared_observation
+
+        current_squared_vol_estimate = (
+            omega
+            + (alpha + beta1 * indicator) * squared_observation
+            + beta0 * current_squared_vol_estimate
+        )
+
+    return gradient
+
+
+def _garch_nll_normal_poisson_mixture(params: np.array, data: np.array) -> float:
+    """
+    Negative log-likelihood of the GJR-GARCH(1,1) model with normal Poisson mixture innovations.
+    See EquityModel._likelihood_function_normal_poisson_mixture for the parameter layout. The
+    variance recursion is compiled, after which the mixture density is evaluated for all
+    observations at once.
+    """
+    squared_volatility = _squared_volatility_path(params, data)
+    # Parameters outside the admissible set may yield a non-positive variance.
+    if np.any(squared_volatility <= 0.0):
+        return np.inf
+    volatility = np.sqrt(squared_volatility)
+    return -np.sum(
+        norm_poisson_mix_logpdf(data, params[4], volatility, params[5], params[6])
+    )
+
+
+def _precondition_parameters(params: np.array) -> np.array:
+    """
+    Maps GJR-GARCH parameters to an unconstrained space in which the model constraints hold by
+    construction, see _uncondition_parameters. Parameters on the boundary of the admissible set
+    are moved slightly inside of it.
+
+    :param params: parameters formatted as [omega, alpha, beta0, beta1, mu] with optional trailing
+                   [kappa, lambda] for the Poisson mixture.
+    :return: transformed parameters.
+    """
+    params = np.asarray(params, dtype=np.float64)
+    omega, alpha, beta0, beta1 = params[0:4]
+
+    beta0 = np.clip(beta0, EPSILON, 1 - EPSILON)
+    alpha_share = np.clip(alpha / (1 - beta0), EPSILON, 1 - EPSILON)
+    beta1_share = np.clip(
+        beta1 / (2 * (1 - beta0) * (1 - alpha_share)), EPSILON, 1 - EPSILON
+    )
+
+    result = params.copy()
+    result[0] = np.log(max(omega, EPSILON))
+    result[1] = np.log(alpha_share / (1 - alpha_share))
+    result[2] = np.log(beta0 / (1 - beta0))
+    result[3] = np.log(beta1_share / (1 - beta1_share))
+    result[5:] = np.log(np.maximum(params[5:], EPSILON))
+    return result
+
+
+@njit("float64[:](float64[:])", cache=True, fastmath=True)
+def _uncondition_parameters(params):
+    """
+    Maps unconstrained parameters back to GJR-GARCH parameters. The persistence beta0 is a
+    sigmoid, alpha takes a sigmoid share of the remaining budget 1 - beta0 and beta1 takes a
+    sigmoid share of what is left after alpha, such that omega > 0, beta0 > 0, alpha + beta1 > 0
+    and alpha + beta0 + beta1 / 2 < 1 always hold. Poisson parameters are exponentiated.
+    """
+    alpha_share = 1.0 / (1.0 + math.exp(-params[1]))
+    beta0 = 1.0 / (1.0 + math.exp(-params[2]))
+    beta1_share = 1.0 / (1.0 + math.exp(-params[3]))
+
+    result = params.copy()
+    result[0] = math.exp(params[0])
+    result[1] = (1.0 - beta0) * alpha_share
+    result[2] = beta0
+    result[3] = 2.0 * (1.0 - beta0) * (1.0 - alpha_share) * beta1_share
+    for i in range(5, len(params)):
+        result[i] = math.exp(params[i])
+    return result
+
+
+@njit("float64(float64[:], float64[:])", cache=True, fastmath=True)
+def _cost_function_normal(params, data):
+    return _garch_nll_normal(_uncondition_parameters(params), data)
+
+
+@njit("float64[:](float64[:], float64[:])", cache=True, fastmath=True)
+def _cost_gradient_normal(params, data):
+    """
+    Gradient of _cost_function_normal, i.e. the likelihood gradient pulled back through
+    _uncondition_parameters by the chain rule.
+    """
+    gradient = _garch_nll_grad_normal(_uncondition_parameters(params), data)
+    alpha_share = 1.0 / (1.0 + math.exp(-params[1]))
+    beta0 = 1.0 / (1.0 + math.exp(-params[2]))
+    beta1_share = 1.0 / (1.0 + math.exp(-params[3]))
+    alpha_share_slope = alpha_share * (1.0 - alpha_share)
+    beta0_slope = beta0 * (1.0 - beta0)
+    beta1_share_slope = beta1_share * (1.0 - beta1_share)
+
+    result = np.empty(5)
+    result[0] = gradient[0] * math.exp(params[0])
+    result[1] = (
+        (1.0 - beta0)
+        * alpha_share_slope
+        * (gradient[1] - 2.0 * beta1_share * gradient[3])
+    )
+    result[2] = beta0_slope * (
+        gradient[2]
+        - alpha_share * gradient[1]
+        - 2.0 * (1.0 - alpha_share) * beta1_share * gradient[3]
+    )
+    result[3] = (
+        2.0 * (1.0 - beta0) * (1.0 - alpha_share) * beta1_share_slope * gradient[3]
+    )
+    result[4] = gradient[4]
+    return result
+
+
+def _cost_function_normal_poisson_mixture(params: np.array, data: np.array) -> float:
+    return _garch_nll_normal_poisson_mixture(_uncondition_parameters(params), data)
+
+
+def _hop_basins(func, x0, minimizer_kwargs, niter, seed):
+    return basinhopping(
+        func,
+        x0,
+        niter=niter,
+        T=1.0,
+        stepsize=0.1,
+        minimizer_kwargs=minimizer_kwargs,
+        seed=seed,
+    )
+
+
+def _minimize_unconstrained(
+    func, x0, data, jac=None, basin_hopping_iterations=0, processes=1
+):
+    """
+    Minimizes an objective over unconstrained parameters with L-BFGS-B. If basin hopping
+    iterations are requested the local minimizer is restarted from random perturbations of the
+    best solution, which guards against poor local optima of the likelihood. With several
+    processes the iterations are split across workers with different seeds and the best result
+    is kept. Several processes cannot be used from within a pool worker, e.g. through fit_many,
+    since daemonic processes are not allowed to have children.
+
+    :param func: objective taking (params, data).
+    :param x0: initial unconstrained parameters.
+    :param data: observations passed on to the objective.
+    :param jac: optional gradient of the objective.
+    :param basin_hopping_iterations: number of basin hopping iterations, zero for a single local search.
+    :param processes: number of worker processes used for basin hopping.
+    :return: scipy OptimizeResult of the best solution found.
+    """
+    minimizer_kwargs = {"method": "L-BFGS-B", "jac": jac, "args": (data,)}
+    if basin_hopping_iterations == 0:
+        return minimize(func, x0, **minimizer_kwargs)
+
+    processes = min(processes, basin_hopping_iterations)
+    if processes == 1:
+        return _hop_basins(func, x0, minimizer_kwargs, basin_hopping_iterations, 0)
+
+    if current_process().daemon:
+        raise ValueError("Parallel basin hopping is not possible within a pool worker.")
+
+    # Split the iterations exactly, the first workers take one extra iteration each.
+    iterations, remainder = divmod(basin_hopping_iterations, processes)
+    with Pool(processes) as pool:
+        solutions = pool.starmap(
+            _hop_basins,
+            [
+                (func, x0, minimizer_kwargs, iterations + (seed < remainder), seed)
+                for seed in range(processes)
+            ],
+        )
+    return min(solutions, key=lambda solution: solution.fun)
+
+
 class EquityModel:
+    # Initial conditions for the GJR-GARCH(1,1) models, formatted as [omega, alpha, beta0, beta1]
+    # followed by [kappa, lambda] for the Poisson mixtures and [nu] for the Student's t mixture.
+    # The initial mu is the sample mean.
+    _INIT = {
+        "normal": (0.001, 0.05, 0.80, 0.02),
+        "normal poisson mixture": (0.001, 0.05, 0.80, 0.02, 0.5, 0.1),
+        "student poisson mixture": (0.001, 0.05, 0.80, 0.02, 0.5, 0.1, 5.0),
+    }
+
     def __init__(self, stock_data):
         self._stock_data = stock_data
         self._model_solution = None
         self._model_fitted = False
+        self._squared_volatility = None
         self._uniform_transformed_returns = []
 
     def run_simulation(self):
         pass
 
-    def fit_model(self, model="normal"):
+    def fit_model(self, model="normal", basin_hopping_iterations=0, processes=1):
+        """
+        Fits a GJR-GARCH(1,1) model to the log-returns of the stock.
+
+        :param model: innovation distribution, one of "normal", "normal poisson mixture" or
+                      "student poisson mixture".
+        :param basin_hopping_iterations: number of basin hopping iterations, zero for a single local search.
+        :param processes: number of worker processes used for basin hopping, must be one when
+                          called from within a pool worker such as fit_many.
+        :return: scipy OptimizeResult. For the GJR-GARCH models fitted over unconstrained parameters
+                 only x is mapped back to the original parameters, jac and hess_inv remain with
+                 respect to the unconstrained parameters of _uncondition_parameters.
+        """
         data = self._stock_data.get_log_returns()
-        data = data["close"]
-        print(np.mean(data))
+        # The compiled likelihoods require a writeable float64 array.
+        data = data["close"].to_numpy(dtype=np.float64, copy=True).ravel()
+        mu0 = data.mean()
 
+        # Both GJR-GARCH models are optimized over unconstrained parameters, see
+        # _uncondition_parameters, which allows for the quasi-Newton L-BFGS-B method.
         if model == "normal":
-            cons = self._likelihood_constraints_normal()
-            func = self._likelihood_function_normal
-
-            # Initial conditions for GJR-GARCH(1,1) model.
-            omega0 = 0.001
-            alpha0 = 0.05
-            beta0 = 0.80
-            beta1 = 0.02
-            mu0 = np.mean(data)
-            x0 = np.array([omega0, alpha0, beta0, beta1, mu0])
-
-            garch_model_solution = minimize(func, x0, constraints=cons, args=data)
+            x0 = _precondition_parameters(np.insert(self._INIT[model], 4, mu0))
+
+            garch_model_solution = _minimize_unconstrained(
+                _cost_function_normal,
+                x0,
+                data,
+                jac=_cost_gradient_normal,
+                basin_hopping_iterations=basin_hopping_iterations,
+                processes=processes,
+            )
+            # Note, jac and hess_inv are left in unconstrained coordinates.
+            garch_model_solution.x = _uncondition_parameters(garch_model_solution.x)
+            self._squared_volatility = _squared_volatility_path(
+                garch_model_solution.x, data
+            )
 
             # Added to keep method non-static. Might be useful to keep in Equity Model object instead of re-running
             # the optimization.
@@ -47,13 +366,20 @@ class EquityModel:
             return garch_model_solution
 
         elif model == "normal poisson mixture":
-            cons = self._likelihood_constraints_normal_poisson_mix()
-            func = self._likelihood_function_normal_poisson_mixture
-            init = self._init
-            x0 = np.array(init)
-            x0 = x0[0:-1]
-            garch_poisson_model_solution = minimize(
-                func, x0, constraints=cons, args=data
+            x0 = _precondition_parameters(np.insert(self._INIT[model], 4, mu0))
+            garch_poisson_model_solution = _minimize_unconstrained(
+                _cost_function_normal_poisson_mixture,
+                x0,
+                data,
+                basin_hopping_iterations=basin_hopping_iterations,
+                processes=processes,
+            )
+            # Note, jac and hess_inv are left in unconstrained coordinates.
+            garch_poisson_model_solution.x = _uncondition_parameters(
+                garch_poisson_model_solution.x
+            )
+            self._squared_volatility = _squared_volatility_path(
+                garch_poisson_model_solution.x, data
             )
 
             self._model_solution = garch_poisson_model_solution.x
@@ -74,15 +400,15 @@ class EquityModel:
             # param[5] is kappa
             # param[6] is lambda
             # param[7] is nu
-            # TODO: Change the order in database such that it matches with init, and the output solution.
             func = self._likelihood_function_student_poisson_mixture
             cons = self._likelihood_constraints_student_poisson_mix()
-            init = self._init
-
-            x0 = np.array(init)
+            x0 = np.insert(self._INIT[model], 4, mu0)
 
             garch_poisson_model_solution = minimize(
-                func, x0, constraints=cons, args=data
+                func, x0, constraints=cons, args=(data,)
+            )
+            self._squared_volatility = _squared_volatility_path(
+                np.asarray(garch_poisson_model_solution.x, dtype=np.float64), data
             )
 
             self._model_solution = garch_poisson_model_solution
@@ -106,50 +432,7 @@ class EquityModel:
         :param data: list of observations, e.g. log-returns over time.
         :return: Negative log-likelihood value.
         """
-        n_observations = len(data)
-        log_likelihood = 0
-        initial_squared_vol_estimate = (
-            params[0]
-            + params[1] * (data[0] ** 2)
-            + params[3] * (data[0] ** 2) * np.where(data[0] < 0, 1, 0)
-            + params[2] * (data[0] ** 2)
-        )
-        current_squared_vol_estimate = initial_squared_vol_estimate
-
-        for i in range(1, n_observations):
-            log_likelihood = (
-                log_likelihood
-                + ((data[i - 1] - params[4]) ** 2) / current_squared_vol_estimate
-                + 2 * np.log(np.sqrt(current_squared_vol_estimate))
-            )
-
-            current_squared_vol_estimate = (
-                params[0]
-                + params[1] * (data[i - 1] ** 2)
-                + params[3] * (data[i - 1] ** 2) * np.where(data[i - 1] < 0, 1, 0)
-                + params[2] * current_squared_vol_estimate
-            )
-
-        return log_likelihood
-
-    # noinspection PyMethodMayBeStatic
-    def _likelihood_constraints_normal(self) -> dict:
-        """
-
-        :return:
-        """
-        # x[0] is omega
-        # x[1] is alpha
-        # x[2] is beta0
-        # x[3] is beta1 (asymmetry modifier)
-
-        cons_garch = [
-            {"type": "ineq", "fun": lambda x: -x[1] - x[2] - (0.5 * x[3]) + 1},
-            {"type": "ineq", "fun": lambda x: x[0]},
-            {"type": "ineq", "fun": lambda x: x[1] + x[3]},
-            {"type": "ineq", "fun": lambda x: x[2]},
-        ]
-        return cons_garch
+        return _garch_nll_normal(params, data)
 
     # noinspection PyMethodMayBeStatic
     def _likelihood_function_normal_poisson_mixture(self, params, data):
@@ -166,47 +449,7 @@ class EquityModel:
         # param[4] is mu
         # param[5] is kappa
         # param[6] is lambda
-        n_observations = len(data)
-        log_likelihood = 0
-        initial_squared_vol_estimate = (
-            params[0]
-            + params[1] * (data[0] ** 2)
-            + params[3] * (data[0] ** 2) * np.where(data[0] < 0, 1, 0)
-            + params[2] * (data[0] ** 2)
-        )
-        current_squared_vol_estimate = initial_squared_vol_estimate
-
-        for i in range(0, n_observations):
-            log_likelihood = log_likelihood + np.log(
-                npm.pdf(
-                    data[i],
-                    params[4],
-                    np.sqrt(current_squared_vol_estimate),
-                    params[5],
-                    params[6],
-                )
-            )
-
-            current_squared_vol_estimate = (
-                params[0]
-                + params[1] * (data[i - 1] ** 2)
-                + params[3] * (data[i - 1] ** 2) * np.where(data[i - 1] < 0, 1, 0)
-                + params[2] * current_squared_vol_estimate
-            )
-
-        return -log_likelihood
-
-    # noinspection PyMethodMayBeStatic
-    def _likelihood_constraints_normal_poisson_mix(self) -> dict:
-        cons_garch_poisson = [
-            {"type": "ineq", "fun": lambda x: -x[1] - x[2] - (0.5 * x[3]) + 1},
-            {"type": "ineq", "fun": lambda x: x[0]},
-            {"type": "ineq", "fun": lambda x: x[1] + x[3]},
-            {"type": "ineq", "fun": lambda x: x[2]},
-            {"type": "ineq", "fun": lambda x: x[5]},
-            {"type": "ineq", "fun": lambda x: x[6]},
-        ]
-        return cons_garch_poisson
+        return _garch_nll_normal_poisson_mixture(params, data)
 
     # noinspection PyMethodMayBeStatic
     def _likelihood_function_student_poisson_mixture(self, params, data):
@@ -224,35 +467,27 @@ class EquityModel:
         # param[5] is kappa
         # param[6] is lambda
         # param[7] is nu
-        n_observations = len(data)
-        log_likelihood = 0
-        initial_squared_vol_estimate = (
-            params[0]
-            + params[1] * (data[0] ** 2)
-            + params[3] * (data[0] ** 2) * np.where(data[0] < 0, 1, 0)
-            + params[2] * (data[0] ** 2)
+        squared_volatility = _squared_volatility_path(
+            np.asarray(params, dtype=np.float64), data
         )
-        current_squared_vol_estimate = initial_squared_vol_estimate
+        # Parameters outside the admissible set may yield a non-positive variance.
+        if np.any(squared_volatility <= 0.0):
+            return np.inf
 
-        for i in range(0, n_observations):
+        volatility = np.sqrt(squared_volatility)
+        log_likelihood = 0
+        for i in range(0, len(data)):
             log_likelihood = log_likelihood + np.log(
                 spm.pdf(
                     data[i],
                     params[4],
-                    np.sqrt(current_squared_vol_estimate),
+                    volatility[i],
                     params[5],
                     params[6],
                     params[7],
                 )
             )
 
-            current_squared_vol_estimate = (
-                params[0]
-                + params[1] * (data[i - 1] ** 2)
-                + params[3] * (data[i - 1] ** 2) * np.where(data[i - 1] < 0, 1, 0)
-                + params[2] * current_squared_vol_estimate
-            )
-
         return -log_likelihood
 
     # noinspection PyMethodMayBeStatic
@@ -283,37 +518,13 @@ class EquityModel:
 
     def plot_volatility(self):
         # Plotting GJR-GARCH fitted volatility.
-        params = self._model_solution.x
-        omg = params[0]
-        alp = params[1]
-        bet = params[2]
-        gam = params[3]
-
-        data = self._stock_data.get_log_returns()
-        time = data.index[1:]
-        data = data["close"]
-        vol = []
+        if self._squared_volatility is None:
+            raise NoParametersError("Model volatility not available.")
 
-        curr_vol = (
-            omg
-            + alp * (data[0] ** 2)
-            + gam * (data[0] ** 2) * np.where(data[0], 1, 0)
-            + bet * (data[0] ** 2)
-        )
-        vol.append(curr_vol)
-
-        for i in range(2, len(data)):
-            curr_vol = (
-                omg
-                + alp * (data[i - 1] ** 2)
-                + gam * (data[i - 1] ** 2) * np.where(data[i - 1] < 0, 1, 0)
-                + bet * (vol[i - 2])
-            )
-            vol.append(curr_vol)
-
-        vol = np.sqrt(vol)
+        time = self._stock_data.get_log_returns().index
+        vol = np.sqrt(self._squared_volatility)
         plt.title(self._stock_data.ric)
-        plt.plot(data.index[21:], vol[20:])
+        plt.plot(time[20:], vol[20:])
         plt.show()
 
     def _generate_uniform_return_observations(self):
@@ -333,7 +544,7 @@ class EquityModel:
         curr_vol = (
             params[0]
             + params[1] * (data[0] ** 2)
-            + params[3] * (data[0] ** 2) * np.where(data[0], 1, 0)
+            + params[3] * (data[0] ** 2) * (data[0] < 0.0)
             + params[2] * (data[0] ** 2)
         )
 
@@ -354,7 +565,7 @@ class EquityModel:
             curr_vol = (
                 params[0]
                 + params[1] * (data[i] ** 2)
-                + params[3] * (data[i] ** 2) * np.where(data[i], 1, 0)
+                + params[3] * (data[i] ** 2) * (data[i] < 0.0)
                 + params[2] * (curr_vol**2)
             )
             print(len(uniforms))
@@ -365,3 +576,23 @@ class EquityModel:
         qqplot(uniforms, norm, fit=False, line="q")
         plt.title(self._stock_data.ric)
         plt.show()
+
+
+def _fit_one(stock_data, model):
+    equity_model = EquityModel(stock_data)
+    equity_model.fit_model(model=model)
+    return equity_model
+
+
+def fit_many(stock_data_list, model="normal", processes=None) -> list:
+    """
+    Fits one EquityModel per stock in parallel worker processes. The fits are independent of
+    each other, hence this scales close to linearly in the number of cores for large portfolios.
+
+    :param stock_data_list: list of stock data objects, one per equity.
+    :param model: innovation distribution passed on to EquityModel.fit_model.
+    :param processes: number of worker processes, defaults to the number of cores.
+    :return: list of fitted EquityModel objects, in the same order as stock_data_list.
+    """
+    with Pool(processes) as pool:
+        return list(pool.imap(partial(_fit_one, model=model), stock_data_list))
@@ -45,7 +45,7 @@ class GJRGARCHNormalPoissonModel(Model):
         initial_squared_vol_estimate = (
             params[0]
             + params[1] * (data[0] ** 2)
-            + params[3] * (data[0] ** 2) * np.where(data[0] < 0, 1, 0)
+            + params[3] * (data[0] ** 2) * (data[0] < 0.0)
             + params[2] * (data[0] ** 2)
         )
         current_squared_vol_estimate = initial_squared_vol_estimate
@@ -64,7 +64,7 @@ class GJRGARCHNormalPoissonModel(Model):
             current_squared_vol_estimate = (
                 params[0]
                 + params[1] * (data[i - 1] ** 2)
-                + params[3] * (data[i - 1] ** 2) * np.where(data[i - 1] < 0, 1, 0)
+                + params[3] * (data[i - 1] ** 2) * (data[i - 1] < 0.0)
                 + params[2] * current_squared_vol_estimate
             )
 
@@ -211,7 +211,7 @@ class GJRGARCH(Model):
                     + 2
                     * (mu_ewma - mu_asym)
                     * self.data[i - 1] ** 2
-                    * np.where(self.data[i - 1] < 0, 1, 0)
+                    * (self.data[i - 1] < 0.0)
                     - self.long_run_volatility_estimate**2
                 )
 
@@ -256,8 +256,7 @@ class GJRGARCH(Model):
             volatility_estimate = np.sqrt(
                 omega
                 + beta * volatility_estimate**2
-                + (alpha + gamma * np.where(return_estimate < 0, 1, 0))
-                * return_estimate**2
+                + (alpha + gamma * (return_estimate < 0.0)) * return_estimate**2
             )
             return_estimate = sample * volatility_estimate
 
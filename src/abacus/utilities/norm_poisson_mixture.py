@@ -2,8 +2,14 @@
 import numpy as np
 
 from scipy.stats import norm, poisson
+from scipy.special import gammaln, logsumexp, xlogy
 from scipy.integrate import quad
 
+# TODO: Add as config variables.
+NUMBER_OF_POISSON_TERMS = 25
+LOWER_INTEGRATION_LIMIT = 6.0
+POISSON_TAIL_PROBABILITY = 1e-12
+
 
 class NormalPoissonMixture:
     """
@@ -11,9 +17,8 @@ class NormalPoissonMixture:
     used by importing the file and using the instance of 'npm' ('normal Poisson mixture').
     """
 
-    # TODO: Add as config variables.
-    NUMBER_OF_POISSON_TERMS = 25
-    LOWER_INTEGRATION_LIMIT = 6.0
+    NUMBER_OF_POISSON_TERMS = NUMBER_OF_POISSON_TERMS
+    LOWER_INTEGRATION_LIMIT = LOWER_INTEGRATION_LIMIT
 
     @staticmethod
     def pdf(
@@ -49,4 +54,55 @@ class NormalPoissonMixture:
         pass
 
 
+def norm_poisson_mix_logpdf(
+    x: np.array,
+    mu: float,
+    sigma: np.array,
+    kappa: float,
+    lamb: float,
+    number_of_terms: int = NUMBER_OF_POISSON_TERMS,
+) -> np.array:
+    """
+    Vectorized log-density of the normal Poisson mixture. Evaluates arrays of observations and
+    volatilities in one go by broadcasting over the Poisson terms, which are combined with
+    logsumexp such that observations far out in the tails do not underflow to log(0). The
+    Poisson sum is truncated once the remaining tail probability is negligible.
+
+    Args:
+        x (np.array): observations.
+        mu (float): location.
+        sigma (np.array): volatility, either scalar or one per observation.
+        kappa (float): jump size scale.
+        lamb (float): Poisson intensity.
+        number_of_terms (int): maximum number of Poisson terms.
+
+    Returns:
+        np.array: log-density for every observation.
+    """
+    tail_terms = poisson.isf(POISSON_TAIL_PROBABILITY, lamb)
+    if np.isfinite(tail_terms):
+        number_of_terms = min(int(tail_terms) + 1, number_of_terms)
+
+    k = np.arange(number_of_terms)
+    log_weights = xlogy(k, lamb) - lamb - gammaln(k + 1)
+    scales = np.multiply.outer(sigma, np.sqrt(1 + k * kappa**2))
+    normalized = (np.expand_dims(x, -1) - mu) / scales
+    log_densities = -0.5 * normalized**2 - np.log(scales * np.sqrt(2 * np.pi))
+    return logsumexp(log_densities + log_weights, axis=-1)
+
+
+def norm_poisson_mix_pdf(
+    x: np.array,
+    mu: float,
+    sigma: np.array,
+    kappa: float,
+    lamb: float,
+    number_of_terms: int = NUMBER_OF_POISSON_TERMS,
+) -> np.array:
+    """
+    Vectorized counterpart of NormalPoissonMixture.pdf, see norm_poisson_mix_logpdf.
+    """
+    return np.exp(norm_poisson_mix_logpdf(x, mu, sigma, kappa, lamb, number_of_terms))
+
+
 npm = NormalPoissonMixture()
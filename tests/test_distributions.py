@@ -30,3 +30,27 @@ def test_pdf_positivity_spm():
 
     for x in space:
         assert spm_pdf(x, 0, 1, 0.001, 0.000001, 5) >= 0
+
+
+def test_vectorized_pdf_npm():
+    npm_pdf = norm_poisson_mixture.npm.pdf
+    space = np.linspace(-5, 5, 101)
+    sigmas = np.linspace(0.5, 2, 101)
+
+    vectorized = norm_poisson_mixture.norm_poisson_mix_pdf(space, 0.1, sigmas, 0.5, 0.3)
+    scalar = [npm_pdf(x, 0.1, sigma, 0.5, 0.3) for x, sigma in zip(space, sigmas)]
+
+    assert np.allclose(vectorized, scalar)
+
+
+def test_logpdf_tail_npm():
+    npm_logpdf = norm_poisson_mixture.norm_poisson_mix_logpdf
+    space = np.linspace(-100, 100, 1000)
+
+    log_densities = npm_logpdf(space, 0, 1, 0.001, 0.000001)
+
+    assert np.all(np.isfinite(log_densities))
+    assert np.allclose(
+        log_densities[500],
+        np.log(norm_poisson_mixture.npm.pdf(space[500], 0, 1, 0.001, 0.000001)),
+    )
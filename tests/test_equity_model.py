@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+from scipy.optimize import approx_fprime
+
+from abacus import legacy
+
+
+def _sample_returns(seed=0, number_of_observations=300):
+    return np.random.default_rng(seed).standard_t(5, number_of_observations) * 0.02
+
+
+class _StockData:
+    def __init__(self, seed):
+        self.ric = f"TEST{seed}"
+        self._log_returns = pd.DataFrame({"close": _sample_returns(seed)})
+
+    def get_log_returns(self):
+        return self._log_returns
+
+
+def test_likelihood_gradient_normal():
+    data = _sample_returns()
+    params = np.array([1e-4, 0.05, 0.8, 0.05, 0.001])
+
+    gradient = legacy._garch_nll_grad_normal(params, data)
+    finite_difference = approx_fprime(
+        params, legacy._garch_nll_normal, 1e-8 * np.maximum(np.abs(params), 1e-4), data
+    )
+
+    assert np.allclose(gradient, finite_difference, rtol=1e-3)
+
+
+def test_parameter_transformation_round_trip():
+    params = np.array([1e-4, 0.05, 0.8, 0.05, 0.001])
+    mixture_params = np.append(params, [0.5, 0.3])
+
+    for p in [params, mixture_params]:
+        transformed = legacy._precondition_parameters(p)
+        assert np.allclose(legacy._uncondition_parameters(transformed), p)
+
+
+def test_cost_gradient_normal():
+    data = _sample_returns()
+    params = legacy._precondition_parameters(np.array([1e-4, 0.05, 0.8, 0.05, 0.001]))
+
+    gradient = legacy._cost_gradient_normal(params, data)
+    finite_difference = approx_fprime(params, legacy._cost_function_normal, 1e-7, data)
+
+    assert np.allclose(gradient, finite_difference, rtol=1e-3)
+
+
+def test_fit_many():
+    stock_data_list = [_StockData(seed) for seed in range(2)]
+
+    models = legacy.fit_many(stock_data_list, processes=2)
+
+    for stock_data, model in zip(stock_data_list, models):
+        sequential_model = legacy.EquityModel(stock_data)
+        sequential_solution = sequential_model.fit_model()
+        assert model._stock_data.ric == stock_data.ric
+        assert np.allclose(model._model_solution.x, sequential_solution.x)
+
+
+def test_likelihood_non_positive_variance():
+    data = _sample_returns()
+    params = np.array([-1e-3, 0.05, 0.8, 0.05, 0.0])
+
+    assert legacy._garch_nll_normal(params, data) == np.inf
+    assert (
+        legacy._garch_nll_normal_poisson_mixture(np.append(params, [0.5, 0.3]), data)
+        == np.inf
+    )
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+
+from abacus.instruments import Equity
+from abacus.utilities.currency_enum import Currency
+
+
+def _price_history():
+    index = pd.date_range("2020-01-01", periods=50, freq="W")
+    prices = np.exp(
+        np.cumsum(np.random.default_rng(0).normal(0, 0.02, (50, 2)), axis=0)
+    )
+    return pd.DataFrame(100 * prices, index=index, columns=["XOM", "CVX"])
+
+
+def test_log_return_history_series():
+    price_history = _price_history()["XOM"]
+    equity = Equity("XOM", Currency.USD, "2020-01-01", "2021-01-01", "wk")
+    equity.set_price_history(price_history)
+
+    expected = np.log(price_history / price_history.shift(1))[1:]
+    pd.testing.assert_series_equal(equity.log_return_history, expected)
+
+
+def test_log_return_history_dataframe():
+    price_history = _price_history()
+    equity = Equity("XOM", Currency.USD, "2020-01-01", "2021-01-01", "wk")
+    equity.set_price_history(price_history)
+
+    expected = np.log(price_history / price_history.shift(1))[1:]
+    pd.testing.assert_frame_equal(equity.log_return_history, expected)